@@ -20,6 +20,7 @@ import time
 import argparse
 import threading
 import queue
+import zlib
 from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import mss
@@ -27,6 +28,22 @@ import serial
 import serial.tools.list_ports
 import os
 
+# Optional: Numba JIT for the sampling kernel (NumPy fallback if missing)
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Optional: DXGI Desktop Duplication capture on Windows - no per-grab
+# GDI BitBlt, the compositor hands over the already-composed frame
+# (mss fallback everywhere else)
+try:
+    import dxcam
+    HAS_DXCAM = sys.platform == 'win32'
+except ImportError:
+    HAS_DXCAM = False
+
 # 💡 LED Configuration
 NUM_LEDS_LEFT = 19
 NUM_LEDS_TOP = 35
@@ -37,13 +54,126 @@ NUM_LEDS_TOTAL = NUM_LEDS_LEFT + NUM_LEDS_TOP + NUM_LEDS_RIGHT
 CAPTURE_DEPTH = 30
 DOWNSAMPLE = 2  # Sample every Nth pixel (2 = half resolution, much faster)
 
-# 📡 Serial
-BAUD_RATE = 115200
+# 📡 Serial - must match Arduino
+# 500000 baud ships a 73-LED frame in ~4.5ms vs ~19.5ms at 115200
+BAUD_RATE = 500000
 
 # 🧵 Threading
 BUFFER_SIZE = 3  # Triple buffer
 
 
+if HAS_NUMBA:
+    def _make_sample_kernel(left_starts, left_ends, top_starts, top_ends,
+                            right_starts, right_ends, ds, depth):
+        """Build an edge sampler specialized for one fixed LED layout.
+
+        The layout never changes after startup, so the segment tables,
+        LED counts, stride and edge depth are closed over and Numba
+        compiles them in as constants: fixed trip counts and per-LED
+        pixel counts instead of runtime arguments (classic partial
+        evaluation). Can't be disk-cached because of the captured
+        arrays, but it is compiled exactly once per run at init.
+        """
+        n_left = left_starts.shape[0]
+        n_top = top_starts.shape[0]
+        n_right = right_starts.shape[0]
+
+        # Per-LED pixel counts, known at build time
+        depth_px = -(-depth // ds)
+        left_counts = -(-(left_ends - left_starts) // ds) * depth_px
+        top_counts = -(-(top_ends - top_starts) // ds) * depth_px
+        right_counts = -(-(right_ends - right_starts) // ds) * depth_px
+
+        @njit(parallel=True, fastmath=True, boundscheck=False)
+        def kernel(left, top, right, out):
+            """Average BGRA edge segments straight into out (RGB).
+
+            Edges arrive reinterpreted as 2D uint32 arrays - one 32-bit
+            load per pixel instead of three strided byte reads, channels
+            unpacked with shifts and masks (SWAR)."""
+            for i in prange(n_left):
+                r = np.int64(0)
+                g = np.int64(0)
+                b = np.int64(0)
+                for y in range(left_starts[i], left_ends[i], ds):
+                    for x in range(0, depth, ds):
+                        p = np.int64(left[y, x])
+                        b += p & 0xFF
+                        g += (p >> 8) & 0xFF
+                        r += (p >> 16) & 0xFF
+                out[i, 0] = r / left_counts[i]
+                out[i, 1] = g / left_counts[i]
+                out[i, 2] = b / left_counts[i]
+
+            for i in prange(n_top):
+                r = np.int64(0)
+                g = np.int64(0)
+                b = np.int64(0)
+                # Rows outer, columns inner: the top buffer is short and
+                # very wide, so the inner loop must stream along a row -
+                # walking a column slice across rows touches a new cache
+                # line per pixel
+                for y in range(0, depth, ds):
+                    for x in range(top_starts[i], top_ends[i], ds):
+                        p = np.int64(top[y, x])
+                        b += p & 0xFF
+                        g += (p >> 8) & 0xFF
+                        r += (p >> 16) & 0xFF
+                out[n_left + i, 0] = r / top_counts[i]
+                out[n_left + i, 1] = g / top_counts[i]
+                out[n_left + i, 2] = b / top_counts[i]
+
+            for i in prange(n_right):
+                r = np.int64(0)
+                g = np.int64(0)
+                b = np.int64(0)
+                for y in range(right_starts[i], right_ends[i], ds):
+                    for x in range(0, depth, ds):
+                        p = np.int64(right[y, x])
+                        b += p & 0xFF
+                        g += (p >> 8) & 0xFF
+                        r += (p >> 16) & 0xFF
+                out[n_left + n_top + i, 0] = r / right_counts[i]
+                out[n_left + n_top + i, 1] = g / right_counts[i]
+                out[n_left + n_top + i, 2] = b / right_counts[i]
+
+        return kernel
+
+    @njit(cache=True, fastmath=True)
+    def _process_colors(colors, prev, out, sat_q, bright_q, alpha_q):
+        """JIT kernel: saturation, brightness, EMA, clip and cast in
+        one cache-resident sweep instead of 4-5 NumPy passes.
+
+        Fixed point: color state is Q6 in int16 - enough headroom to
+        carry saturation overshoot outside [0, 255] through the EMA the
+        way the float pipeline did - coefficients Q8, math in int32."""
+        for i in range(colors.shape[0]):
+            c0 = np.int32(colors[i, 0] * 64.0)
+            c1 = np.int32(colors[i, 1] * 64.0)
+            c2 = np.int32(colors[i, 2] * 64.0)
+            gray = (c0 + c1 + c2) // 3
+            for c in range(3):
+                v = np.int32(colors[i, c] * 64.0)
+                v = gray + ((v - gray) * sat_q >> 8)
+                v = v * bright_q >> 8
+                p = np.int32(prev[i, c])
+                p = p + ((v - p) * alpha_q >> 8)
+                # Saturate into the int16 state: extreme saturation
+                # boosts can overshoot past Q6's headroom, and a wrap
+                # here would flicker forever
+                if p > 32767:
+                    p = np.int32(32767)
+                elif p < -32768:
+                    p = np.int32(-32768)
+                prev[i, c] = np.int16(p)
+                o = p >> 6
+                if o < 0:
+                    o = 0
+                elif o > 255:
+                    o = 255
+                out[i, c] = np.uint8(o)
+
+
 def set_process_priority():
     """Set process priority."""
     try:
@@ -56,38 +186,87 @@ def set_process_priority():
         pass
 
 
+def pin_thread(cpu_idx):
+    """📌 Pin the calling thread to one core for stable cache residency."""
+    if (os.cpu_count() or 1) <= cpu_idx:
+        return  # not enough cores - let the scheduler decide
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadAffinityMask(
+                kernel32.GetCurrentThread(), 1 << cpu_idx)
+        else:
+            os.sched_setaffinity(0, {cpu_idx})
+    except (AttributeError, OSError):
+        pass
+
+
+def raise_thread_priority():
+    """Bump the calling thread above normal - the process itself stays
+    at BELOW_NORMAL so background workloads remain friendly."""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            THREAD_PRIORITY_ABOVE_NORMAL = 1
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(),
+                                       THREAD_PRIORITY_ABOVE_NORMAL)
+    except AttributeError:
+        pass
+
+
 class RingBuffer:
-    """🔄 Lock-free single producer single consumer ring buffer."""
-    
+    """🔄 Lock-free single producer single consumer ring buffer.
+
+    No mutex: aligned word-sized stores are atomic under the GIL, and
+    the GIL hand-off orders the slot write before the counter publish.
+    Invariant: exactly one producer thread calls put_with() and exactly
+    one consumer thread calls get().
+    """
+
     def __init__(self, size, shape, dtype=np.uint8):
         self.size = size
         self.buffers = [np.zeros(shape, dtype=dtype) for _ in range(size)]
-        self.write_idx = 0
-        self.read_idx = 0
-        self.count = 0
-        self.lock = threading.Lock()
-    
-    def put(self, data):
-        """Non-blocking put - overwrites oldest if full."""
-        with self.lock:
-            np.copyto(self.buffers[self.write_idx], data)
-            self.write_idx = (self.write_idx + 1) % self.size
-            if self.count < self.size:
-                self.count += 1
-            else:
-                self.read_idx = (self.read_idx + 1) % self.size
-    
+        # Monotonic counters: the producer owns write_count, the consumer
+        # owns read_count (the write_count value it last consumed)
+        self.write_count = np.zeros(1, dtype=np.uint64)
+        self.read_count = np.zeros(1, dtype=np.uint64)
+        # Signals the consumer the moment new data is published, so it
+        # can wait on this instead of polling with sleeps
+        self.data_ready = threading.Event()
+
+    def put_with(self, fill):
+        """Zero-copy put: fill(slot) writes the producer's slot directly,
+        then the slot is published. Overwrites oldest if full."""
+        wc = int(self.write_count[0])
+        fill(self.buffers[wc % self.size])
+        # Publish only after the slot write is complete
+        self.write_count[0] = wc + 1
+        self.data_ready.set()
+
+    def wait(self, timeout=None):
+        """Block until the producer publishes new data (or timeout)."""
+        return self.data_ready.wait(timeout)
+
     def get(self):
-        """Get latest data, returns None if empty."""
-        with self.lock:
-            if self.count == 0:
-                return None
-            # Get most recent
-            idx = (self.write_idx - 1) % self.size
-            data = self.buffers[idx].copy()
-            self.count = 0  # Mark as consumed
-            self.read_idx = self.write_idx
-            return data
+        """Borrow the latest slot, returns None if nothing new.
+
+        Zero-copy: the returned array IS the producer's slot - treat it
+        as read-only. It stays valid until the producer has advanced
+        size-1 further slots, which at these frame rates gives the
+        consumer a full frame interval to use it.
+        """
+        wc = int(self.write_count[0])  # one read of the shared counter
+        if wc == int(self.read_count[0]):
+            return None
+        # Most recent completed slot
+        buf = self.buffers[(wc - 1) % self.size]
+        self.read_count[0] = wc
+        # Losing a set() between the read and this clear is harmless:
+        # get() decides from the counters, not the event
+        self.data_ready.clear()
+        return buf
 
 
 class ScreenCapture:
@@ -95,150 +274,328 @@ class ScreenCapture:
     
     def __init__(self, monitor_num=0):
         self.sct = mss.mss()
+        # mss handles are not thread-safe: each executor worker lazily
+        # opens its own via thread-local storage
+        self._tls = threading.local()
         self._setup_monitor(monitor_num)
         self._precompute_indices()
-        
+        if HAS_NUMBA:
+            # Specialize the sampler for this exact layout and compile
+            # it now, off the hot path
+            self._sampler = _make_sample_kernel(
+                self.left_starts_px, self.left_ends_px,
+                self.top_starts_px, self.top_ends_px,
+                self.right_starts_px, self.right_ends_px,
+                DOWNSAMPLE, CAPTURE_DEPTH)
+            self._warmup_kernel()
+
     def _setup_monitor(self, monitor_num):
         monitors = self.sct.monitors
         idx = min(monitor_num + 1, len(monitors) - 1)
         mon = monitors[idx]
-        
+        self.output_idx = max(idx - 1, 0)  # dxcam counts from the first real monitor
+
         self.width = mon['width']
         self.height = mon['height']
         d = CAPTURE_DEPTH
-        
+
         self.regions = {
-            'left': {'left': mon['left'], 'top': mon['top'], 
+            'left': {'left': mon['left'], 'top': mon['top'],
                      'width': d, 'height': mon['height']},
-            'top': {'left': mon['left'], 'top': mon['top'], 
+            'top': {'left': mon['left'], 'top': mon['top'],
                     'width': mon['width'], 'height': d},
-            'right': {'left': mon['left'] + mon['width'] - d, 'top': mon['top'], 
+            'right': {'left': mon['left'] + mon['width'] - d, 'top': mon['top'],
                       'width': d, 'height': mon['height']}
         }
-        
         print(f"📺 Monitor: {self.width}x{self.height}, Capture Depth: {d} pixels")
     
     def _precompute_indices(self):
-        """Pre-compute all sampling indices for vectorized operations."""
+        """Pre-compute reduceat segment boundaries for vectorized sampling."""
         v_seg = self.height // NUM_LEDS_LEFT
         h_seg = self.width // NUM_LEDS_TOP
         ds = DOWNSAMPLE
-        
-        # Left: bottom to top (reversed indices)
-        self.left_slices = []
-        for i in range(NUM_LEDS_LEFT):
-            y = self.height - (i + 1) * v_seg
-            self.left_slices.append((
-                slice(y, y + v_seg, ds),  # y slice with downsample
-                slice(None, None, ds)      # x slice with downsample
-            ))
-        
-        # Top: left to right
-        self.top_slices = []
-        for i in range(NUM_LEDS_TOP):
-            x = i * h_seg
-            self.top_slices.append((
-                slice(None, None, ds),
-                slice(x, x + h_seg, ds)
-            ))
-        
-        # Right: top to bottom
-        self.right_slices = []
-        for i in range(NUM_LEDS_RIGHT):
-            y = i * v_seg
-            self.right_slices.append((
-                slice(y, y + v_seg, ds),
-                slice(None, None, ds)
-            ))
-    
-    def capture_region(self, name):
-        """Capture single region - for parallel execution."""
-        shot = self.sct.grab(self.regions[name])
+        d = CAPTURE_DEPTH
+
+        # Sizes of the [::ds, ::ds] downsampled edge views
+        depth_px = (d + ds - 1) // ds
+        h_ds = (self.height + ds - 1) // ds
+        w_ds = (self.width + ds - 1) // ds
+
+        # Left runs bottom-to-top: segments are stored top-to-bottom here
+        # and the per-frame means get reversed at assignment time
+        y0 = self.height - NUM_LEDS_LEFT * v_seg
+        self.left_starts = (y0 + np.arange(NUM_LEDS_LEFT) * v_seg) // ds
+        self.top_starts = (np.arange(NUM_LEDS_TOP) * h_seg) // ds
+        self.right_starts = (np.arange(NUM_LEDS_RIGHT) * v_seg) // ds
+
+        # Pixels per segment (last segment absorbs the division remainder)
+        left_ends = np.append(self.left_starts[1:], h_ds)
+        top_ends = np.append(self.top_starts[1:], w_ds)
+        right_ends = np.append(self.right_starts[1:], h_ds)
+        self.left_counts = ((left_ends - self.left_starts) * depth_px).astype(np.float32)
+        self.top_counts = ((top_ends - self.top_starts) * depth_px).astype(np.float32)
+        self.right_counts = ((right_ends - self.right_starts) * depth_px).astype(np.float32)
+
+        # Full-resolution bounds for the Numba kernel, in LED order
+        # (left edge already reversed to bottom-to-top)
+        self.left_starts_px = (y0 + np.arange(NUM_LEDS_LEFT) * v_seg)[::-1].copy()
+        self.left_ends_px = self.left_starts_px + v_seg
+        self.top_starts_px = np.arange(NUM_LEDS_TOP) * h_seg
+        self.top_ends_px = np.append(self.top_starts_px[1:], self.width)
+        self.right_starts_px = np.arange(NUM_LEDS_RIGHT) * v_seg
+        self.right_ends_px = np.append(self.right_starts_px[1:], self.height)
+
+    def _warmup_kernel(self):
+        """Trigger the one-off JIT compile before the capture loop starts.
+
+        The warmup arrays must match the layout of the real frames or
+        Numba re-specializes (several seconds) on the first capture:
+        DXGI edges are strided views into one full frame, mss edges are
+        contiguous per-region buffers.
+        """
+        d = CAPTURE_DEPTH
+        out = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.float32)
+        if HAS_DXCAM:
+            frame = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            self._sampler(frame[:, :d].view(np.uint32)[:, :, 0],
+                          frame[:d, :].view(np.uint32)[:, :, 0],
+                          frame[:, -d:].view(np.uint32)[:, :, 0],
+                          out)
+        else:
+            side = np.zeros((self.height, d), dtype=np.uint32)
+            top = np.zeros((d, self.width), dtype=np.uint32)
+            self._sampler(side, top, side, out)
+
+    def _grab_one(self, name):
+        """Grab one region with this worker thread's own mss handle."""
+        sct = getattr(self._tls, 'sct', None)
+        if sct is None:
+            sct = self._tls.sct = mss.mss()
+        shot = sct.grab(self.regions[name])
         # Direct buffer access, reshape in place
         img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
             shot.height, shot.width, 4)
         return name, img
-    
-    def sample_colors_vectorized(self, left_img, top_img, right_img):
-        """Sample all colors using vectorized operations."""
-        colors = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.float32)
-        
-        # Left edge - BGR to RGB conversion with [2,1,0]
-        for i, (ys, xs) in enumerate(self.left_slices):
-            segment = left_img[ys, xs, :3]
-            colors[i] = segment[:, :, [2,1,0]].mean(axis=(0,1))
-        
-        # Top edge
+
+    def open_thread_grabber(self):
+        """Per-thread capture handle (neither backend is thread-safe)."""
+        if HAS_DXCAM:
+            # BGRA output keeps the buffer layout identical to mss
+            return dxcam.create(output_idx=self.output_idx,
+                                output_color="BGRA")
+        return mss.mss()
+
+    def close_thread_grabber(self, grabber):
+        if HAS_DXCAM:
+            grabber.release()
+
+    def grab_edges(self, grabber, executor=None):
+        """Grab the three edges as BGRA arrays.
+
+        DXGI: one full-frame acquire, edges sliced out as views.
+        mss: the three region BitBlts are issued concurrently on the
+        executor so their kernel-mode waits overlap.
+        Returns None when DXGI has no new frame since the last grab.
+        """
+        if HAS_DXCAM:
+            # No region: dxcam regions are output-relative (not virtual
+            # desktop coordinates) and we want the whole output anyway
+            frame = grabber.grab()
+            if frame is None:  # desktop unchanged since last acquire
+                return None
+            d = CAPTURE_DEPTH
+            return {'left': frame[:, :d], 'top': frame[:d, :],
+                    'right': frame[:, -d:]}
+        if executor is not None:
+            futures = [executor.submit(self._grab_one, name)
+                       for name in ('left', 'top', 'right')]
+            return dict(f.result() for f in futures)
+        images = {}
+        for name, rg in self.regions.items():
+            shot = grabber.grab(rg)
+            images[name] = np.frombuffer(
+                shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return images
+
+    def sample_colors_vectorized(self, left_img, top_img, right_img,
+                                 out=None):
+        """Sample all colors - Numba kernel if available, NumPy otherwise.
+
+        Results are written into out when given (e.g. a ring buffer slot,
+        so samples land in shared memory with no intermediate copy)."""
+        if out is None:
+            out = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.float32)
+        colors = out
+        ds = DOWNSAMPLE
+
+        if HAS_NUMBA:
+            # Reinterpret each BGRA pixel as one uint32 (zero-copy view)
+            self._sampler(left_img.view(np.uint32)[:, :, 0],
+                          top_img.view(np.uint32)[:, :, 0],
+                          right_img.view(np.uint32)[:, :, 0],
+                          colors)
+            return colors
+
+        # Left edge: collapse the depth axis first, then one reduceat over
+        # the row axis covers all LEDs at once
+        lv = left_img[::ds, ::ds, :3]
+        col_sum = lv.sum(axis=1, dtype=np.float32)
+        seg_sums = np.add.reduceat(col_sum, self.left_starts, axis=0)
+        # Segments are top-to-bottom, LEDs bottom-to-top
+        colors[:NUM_LEDS_LEFT] = (seg_sums / self.left_counts[:, None])[::-1]
+
+        # Top edge: collapse rows, reduceat over columns
+        tv = top_img[::ds, ::ds, :3]
+        row_sum = tv.sum(axis=0, dtype=np.float32)
+        seg_sums = np.add.reduceat(row_sum, self.top_starts, axis=0)
         base = NUM_LEDS_LEFT
-        for i, (ys, xs) in enumerate(self.top_slices):
-            segment = top_img[ys, xs, :3]
-            colors[base + i] = segment[:, :, [2,1,0]].mean(axis=(0,1))
-        
+        colors[base:base + NUM_LEDS_TOP] = (seg_sums / self.top_counts[:, None])
+
         # Right edge
+        rv = right_img[::ds, ::ds, :3]
+        col_sum = rv.sum(axis=1, dtype=np.float32)
+        seg_sums = np.add.reduceat(col_sum, self.right_starts, axis=0)
         base = NUM_LEDS_LEFT + NUM_LEDS_TOP
-        for i, (ys, xs) in enumerate(self.right_slices):
-            segment = right_img[ys, xs, :3]
-            colors[base + i] = segment[:, :, [2,1,0]].mean(axis=(0,1))
-        
+        colors[base:base + NUM_LEDS_RIGHT] = (seg_sums / self.right_counts[:, None])
+
+        # Means were accumulated in BGR order; one strided flip of the
+        # 73x3 result converts every LED to RGB at once
+        colors[:] = colors[:, ::-1]
+
         return colors
 
 
 class ColorProcessor:
     """Processes colors with smoothing and effects."""
     
-    def __init__(self, brightness=1.0, saturation=1.2, smoothing=0.6):
+    def __init__(self, brightness=1.0, saturation=1.2, smoothing=0.6,
+                 out=None):
         self.brightness = brightness
         self.saturation = saturation
         self.smoothing = smoothing
-        self.prev_colors = None
-        
-        # Pre-allocate output buffer
-        self.output = np.zeros((NUM_LEDS_TOTAL, 3), dtype=np.uint8)
+
+        # Q8 fixed-point coefficients (color state is Q6 int16)
+        self.sat_q = int(round(saturation * 256))
+        self.bright_q = int(round(brightness * 256))
+        self.alpha_q = int(round(smoothing * 256))
+
+        # EMA state, allocated once; the first frame lerps with alpha=1
+        # against the zeros so no per-frame "is this the first?" branch
+        self.prev_colors = np.zeros((NUM_LEDS_TOTAL, 3), dtype=np.int16)
+        self._next_alpha_q = 256
+
+        # True once the EMA has stopped moving - the skip paths must
+        # keep feeding frames through until then or the smoothing
+        # freezes partway to the last color change
+        self.settled = True
+        self._prev_snap = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.int16)
+
+        # Scratch for the NumPy fallback - all casts go through copyto
+        # into these, so that path allocates nothing per frame either
+        self._c32 = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.int32)
+        self._p32 = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.int32)
+        self._gray = np.empty((NUM_LEDS_TOTAL, 1), dtype=np.int32)
+        self._f32 = np.empty((NUM_LEDS_TOTAL, 3), dtype=np.float32)
+
+        # Output buffer - the serial sender's payload view when wired up,
+        # so processed colors land directly in the outgoing frame
+        if out is None:
+            out = np.zeros((NUM_LEDS_TOTAL, 3), dtype=np.uint8)
+        self.output = out
+
+        if HAS_NUMBA:
+            # One-off JIT compile off the hot path
+            _process_colors(np.zeros((1, 3), dtype=np.float32),
+                            np.zeros((1, 3), dtype=np.int16),
+                            np.zeros((1, 3), dtype=np.uint8),
+                            self.sat_q, self.bright_q, self.alpha_q)
     
     def process(self, colors):
         """Apply all color transformations."""
-        # Saturation boost (vectorized)
-        if self.saturation != 1.0:
-            gray = colors.mean(axis=1, keepdims=True)
-            colors = gray + (colors - gray) * self.saturation
-        
-        # Brightness
-        if self.brightness != 1.0:
-            colors *= self.brightness
-        
+        alpha_q = self._next_alpha_q
+        self._next_alpha_q = self.alpha_q
+        np.copyto(self._prev_snap, self.prev_colors)
+
+        if HAS_NUMBA:
+            _process_colors(colors, self.prev_colors, self.output,
+                            self.sat_q, self.bright_q, alpha_q)
+            self.settled = np.array_equal(self.prev_colors, self._prev_snap)
+            return self.output
+
+        # NumPy fallback: same fixed-point math, vectorized and fully
+        # in-place (no astype allocations - casts land in scratch).
+        # colors may be a borrowed ring buffer slot, so it is never
+        # written to - the Q6 conversion lands in scratch instead
+        c = self._c32
+        gray = self._gray
+        np.multiply(colors, 64.0, out=self._f32)
+        np.copyto(c, self._f32, casting='unsafe')
+        np.sum(c, axis=1, keepdims=True, out=gray)
+        gray //= 3
+        np.subtract(c, gray, out=c)
+        c *= self.sat_q
+        c >>= 8
+        c += gray
+        c *= self.bright_q
+        c >>= 8
+
         # Temporal smoothing (EMA)
-        if self.prev_colors is None:
-            self.prev_colors = colors.copy()
-        else:
-            alpha = self.smoothing
-            colors = self.prev_colors + alpha * (colors - self.prev_colors)
-            np.copyto(self.prev_colors, colors)
-        
-        # Clip and convert (in-place)
-        np.clip(colors, 0, 255, out=colors)
-        np.copyto(self.output, colors.astype(np.uint8))
+        p = self._p32
+        np.copyto(p, self.prev_colors)
+        np.subtract(c, p, out=c)
+        c *= alpha_q
+        c >>= 8
+        p += c
+        # Saturate into the int16 state (see the kernel) - extreme
+        # saturation overshoot must not wrap
+        np.clip(p, -32768, 32767, out=p)
+        np.copyto(self.prev_colors, p, casting='unsafe')
+
+        # Convert Q6 back to uint8, casting straight into the output
+        p >>= 6
+        np.clip(p, 0, 255, out=p)
+        np.copyto(self.output, p, casting='unsafe')
+        self.settled = np.array_equal(self.prev_colors, self._prev_snap)
         return self.output
 
 
 class SerialSender:
     """🤖 Handles serial communication with Arduino."""
     
-    def __init__(self, port=None):
+    def __init__(self, port=None, baud=BAUD_RATE):
+        self.baud = baud
         self.serial = self._connect(port)
         
         # Pre-build Adalight header
         count = NUM_LEDS_TOTAL - 1
         hi, lo = (count >> 8) & 0xFF, count & 0xFF
         self.header = bytes([ord('A'), ord('d'), ord('a'), hi, lo, hi ^ lo ^ 0x55])
-    
+
+        # One preformatted frame, header prewritten. payload_view shares
+        # memory with the bytearray so the color processor fills the
+        # payload in place and send() writes a single object - no
+        # header + tobytes() concatenation per frame
+        self._frame = bytearray(len(self.header) + NUM_LEDS_TOTAL * 3)
+        self._frame[:len(self.header)] = self.header
+        self.payload_view = np.frombuffer(
+            self._frame, dtype=np.uint8,
+            offset=len(self.header)).reshape(NUM_LEDS_TOTAL, 3)
+
     def _connect(self, port):
         if port is None:
             port = self._auto_detect()
         
         print(f"🔌 Connecting to {port}...")
         try:
-            ser = serial.Serial(port, BAUD_RATE, timeout=1)
+            ser = serial.Serial(port, self.baud, timeout=1, write_timeout=0)
             print(f"✓ Successfully opened {port}")
+            # Windows: enlarge the kernel TX buffer so a frame write
+            # never stalls behind the serial drain rate
+            if sys.platform == 'win32':
+                try:
+                    ser.set_buffer_size(rx_size=4096, tx_size=65536)
+                except (AttributeError, serial.SerialException):
+                    pass
             time.sleep(2)
             ser.reset_input_buffer()
             
@@ -276,19 +633,35 @@ class SerialSender:
         print("❌ No serial ports found!")
         sys.exit(1)
     
-    def send(self, colors):
-        """📤 Send colors to Arduino."""
+    def send(self):
+        """📤 Send the preformatted frame to Arduino (latest wins)."""
         try:
-            self.serial.write(self.header + colors.tobytes())
+            # If the OS buffer is still draining older frames, drop this
+            # one - same overwrite-oldest policy as the ring buffer
+            if self.serial.out_waiting > 2 * len(self._frame):
+                return True
+            self.serial.write(self._frame)
             return True
+        except serial.SerialTimeoutException:
+            return True  # TX buffer momentarily full - drop the frame
         except:
             return False
-    
+
     def close(self):
         if self.serial and self.serial.is_open:
-            # Send black
-            black = np.zeros((NUM_LEDS_TOTAL, 3), dtype=np.uint8)
-            self.send(black)
+            # The black frame must actually arrive or the LEDs stay lit
+            # after exit, so bypass send()'s latest-wins drop heuristic:
+            # wait out the TX backlog and write blocking for this one
+            try:
+                deadline = time.time() + 1.0
+                while self.serial.out_waiting and time.time() < deadline:
+                    time.sleep(0.01)
+                self.payload_view[:] = 0
+                self.serial.write_timeout = 1.0
+                self.serial.write(self._frame)
+                self.serial.flush()
+            except serial.SerialException:
+                pass
             time.sleep(0.05)
             self.serial.close()
 
@@ -297,58 +670,119 @@ class AmbilightPro:
     """✨ Main Ambilight controller with multithreading."""
     
     def __init__(self, port=None, monitor=0, fps=30, brightness=255,
-                 saturation=1.2, smoothing=0.6):
-        
+                 saturation=1.2, smoothing=0.6, baud=BAUD_RATE):
+
         self.target_fps = min(fps, 60)
         self.running = False
         
-        # Components
+        # Components (processor writes straight into the sender's frame)
         self.capture = ScreenCapture(monitor)
+        self.sender = SerialSender(port, baud)
         self.processor = ColorProcessor(
-            brightness / 255.0, saturation, smoothing)
-        self.sender = SerialSender(port)
+            brightness / 255.0, saturation, smoothing,
+            out=self.sender.payload_view)
         
         # Threading
         self.color_buffer = RingBuffer(BUFFER_SIZE, (NUM_LEDS_TOTAL, 3), np.float32)
         self.capture_thread = None
         self.executor = ThreadPoolExecutor(max_workers=3)
-        
-        # Stats
+        # Spawn all workers now, from the not-yet-pinned main thread:
+        # they are otherwise created lazily on first submit from the
+        # pinned capture thread, and Linux threads inherit the
+        # creator's affinity - the three "overlapped" grabs would all
+        # share the capture core
+        gate = threading.Barrier(4)
+        for _ in range(3):
+            self.executor.submit(gate.wait)
+        gate.wait()
+        
+        # Stats - the main loop only bumps _frame_counter; a background
+        # logger thread does the timing, formatting and printing so no
+        # console I/O ever lands on the frame deadline
         self.stats = {'capture': 0, 'process': 0, 'send': 0, 'frames': 0}
-        self.last_stats = time.time()
+        self._frame_counter = 0
+        self.stats_thread = None
     
     def _capture_loop(self):
         """Capture thread - runs independently."""
-        # Each thread needs its own mss instance
-        local_sct = mss.mss()
-        regions = self.capture.regions
-        
+        pin_thread(2)  # own core: keeps edge buffers + ring slots hot
+        grabber = None
+        try:
+            # Each thread needs its own capture handle
+            grabber = self.capture.open_thread_grabber()
+            prev_hash = 0
+
+            while self.running:
+                t0 = time.perf_counter()
+
+                # Capture all 3 edges (DXGI where available, else mss
+                # with the three BitBlts overlapped on the executor)
+                images = self.capture.grab_edges(grabber, self.executor)
+                if images is None:
+                    # Desktop unchanged - nothing new to sample
+                    time.sleep(0.5 / self.target_fps)
+                    continue
+
+                # Cheap change detection: CRC over every 16th pixel of
+                # each edge. On a static scene this skips sampling,
+                # publishing and ultimately the serial write entirely -
+                # but only once the EMA has settled, otherwise the
+                # smoothing would freeze partway to the new color
+                h = (zlib.crc32(images['left'][::16, ::16].tobytes())
+                     ^ zlib.crc32(images['top'][::16, ::16].tobytes())
+                     ^ zlib.crc32(images['right'][::16, ::16].tobytes()))
+                if h == prev_hash and self.processor.settled:
+                    time.sleep(0.5 / self.target_fps)
+                    continue
+                prev_hash = h
+
+                # Sample straight into the ring buffer slot - the colors
+                # never exist anywhere but the shared memory the
+                # consumer will read from
+                self.color_buffer.put_with(
+                    lambda slot: self.capture.sample_colors_vectorized(
+                        images['left'], images['top'], images['right'],
+                        out=slot))
+
+                self.stats['capture'] = time.perf_counter() - t0
+
+                # Throttle capture to ~2x target FPS (provides buffer)
+                target_time = 0.5 / self.target_fps
+                elapsed = time.perf_counter() - t0
+                if elapsed < target_time:
+                    time.sleep(target_time - elapsed)
+        except Exception as e:
+            # Never die silently: a dead capture thread would leave the
+            # app running with dark LEDs, so report and stop everything
+            print(f"\n✗ Capture error: {e}")
+            self.running = False
+        finally:
+            if grabber is not None:
+                self.capture.close_thread_grabber(grabber)
+
+    def _stats_loop(self):
+        """Logger thread - prints stats every 3s off the hot path.
+
+        Reading the counter and then clearing it races with the main
+        loop's increment, but losing a frame or two of accounting every
+        3 seconds is noise; what matters is that print() (which can
+        block on the Windows console) never runs on a frame deadline.
+        """
+        interval = 3.0
         while self.running:
-            t0 = time.perf_counter()
-            
-            # Capture all 3 regions (can't parallelize mss easily)
-            images = {}
-            for name in ['left', 'top', 'right']:
-                shot = local_sct.grab(regions[name])
-                images[name] = np.frombuffer(
-                    shot.raw, dtype=np.uint8
-                ).reshape(shot.height, shot.width, 4)
-            
-            # Sample colors
-            colors = self.capture.sample_colors_vectorized(
-                images['left'], images['top'], images['right'])
-            
-            # Put in buffer (non-blocking)
-            self.color_buffer.put(colors)
-            
-            self.stats['capture'] = time.perf_counter() - t0
-            
-            # Throttle capture to ~2x target FPS (provides buffer)
-            target_time = 0.5 / self.target_fps
-            elapsed = time.perf_counter() - t0
-            if elapsed < target_time:
-                time.sleep(target_time - elapsed)
-    
+            time.sleep(interval)
+            frames = self._frame_counter
+            self._frame_counter = 0
+            fps = frames / interval
+            cap_ms = self.stats['capture'] * 1000
+            proc_ms = self.stats['process'] * 1000
+            send_ms = self.stats['send'] * 1000
+
+            print(f"📊 FPS: {fps:.1f} | "
+                  f"Capture: {cap_ms:.1f}ms | "
+                  f"Processing: {proc_ms:.1f}ms | "
+                  f"Serial: {send_ms:.1f}ms    ", end='\r')
+
     def run(self):
         """Main loop with separate capture thread."""
         print(f"\n=== Ambilight PRO (Multithreaded) ===")
@@ -357,29 +791,44 @@ class AmbilightPro:
         print(f"Downsampling: {DOWNSAMPLE}x (sampling every {DOWNSAMPLE} pixels)")
         print(f"Buffer Size: {BUFFER_SIZE} frames (triple buffering)")
         print("Press Ctrl+C to stop\n")
-        
+
+        # Dedicated core for process+send, kept off the capture core so
+        # the EMA state and frame buffer stay cache-resident
+        pin_thread(3)
+        raise_thread_priority()
+
         self.running = True
         frame_time = 1.0 / self.target_fps
         
-        # Start capture thread
+        # Start capture and logger threads
         self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.capture_thread.start()
-        
+        self.stats_thread = threading.Thread(target=self._stats_loop, daemon=True)
+        self.stats_thread.start()
+
         # Wait for first capture
         time.sleep(0.1)
-        
-        frame_count = 0
-        last_print = time.time()
-        
+
+        last_colors = None
+
         try:
             while self.running:
                 t0 = time.perf_counter()
-                
-                # Get latest colors from buffer
+
+                # Borrow the latest slot (zero-copy); wake the instant
+                # the capture thread publishes instead of polling
                 colors = self.color_buffer.get()
                 if colors is None:
-                    time.sleep(0.001)
-                    continue
+                    if self.processor.settled or last_colors is None:
+                        self.color_buffer.wait(timeout=frame_time)
+                        continue
+                    # Nothing new published (DXGI reports no frame at
+                    # all for an unchanged desktop) but the smoothing
+                    # hasn't finished - keep lerping toward the last
+                    # target so the transition runs to completion
+                    colors = last_colors
+                else:
+                    last_colors = colors
                 
                 # Process
                 t1 = time.perf_counter()
@@ -388,31 +837,14 @@ class AmbilightPro:
                 
                 # Send
                 t2 = time.perf_counter()
-                if not self.sender.send(output):
+                if not self.sender.send():
                     print("\nSerial error!")
                     break
                 self.stats['send'] = time.perf_counter() - t2
-                
-                frame_count += 1
-                
-                # Print stats every 3 seconds
-                now = time.time()
-                if now - last_print > 3.0:
-                    fps = frame_count / (now - last_print)
-                    cap_ms = self.stats['capture'] * 1000
-                    proc_ms = self.stats['process'] * 1000
-                    send_ms = self.stats['send'] * 1000
-                    total_ms = (time.perf_counter() - t0) * 1000
-                    
-                    print(f"📊 FPS: {fps:.1f} | "
-                          f"Capture: {cap_ms:.1f}ms | "
-                          f"Processing: {proc_ms:.1f}ms | "
-                          f"Serial: {send_ms:.1f}ms | "
-                          f"Total: {total_ms:.1f}ms    ", end='\r')
-                    
-                    frame_count = 0
-                    last_print = now
-                
+
+                # The logger thread handles timing and printing
+                self._frame_counter += 1
+
                 # Frame timing
                 elapsed = time.perf_counter() - t0
                 sleep_time = frame_time - elapsed - 0.0005
@@ -468,6 +900,8 @@ Examples:
                        help='Saturation boost (default: 1.2)')
     parser.add_argument('--smoothing', type=float, default=0.6,
                        help='Temporal smoothing 0.0-1.0 (default: 0.6)')
+    parser.add_argument('--baud', type=int, default=BAUD_RATE,
+                       help=f'Serial baud rate, must match Arduino (default: {BAUD_RATE})')
     parser.add_argument('--list-ports', action='store_true',
                        help='List serial ports and exit 🔍')
     
@@ -485,7 +919,8 @@ Examples:
         fps=args.fps,
         brightness=args.brightness,
         saturation=args.saturation,
-        smoothing=args.smoothing
+        smoothing=args.smoothing,
+        baud=args.baud
     ).run()
 
 
@@ -29,9 +29,11 @@ NUM_LEDS_TOTAL = NUM_LEDS_LEFT + NUM_LEDS_TOP + NUM_LEDS_RIGHT
 
 # 📷 Screen capture zone depth (pixels from edge)
 CAPTURE_DEPTH = 30  # Smaller = faster
+DOWNSAMPLE = 2  # Sample every Nth pixel (2 = quarter the data, much faster)
 
 # 📡 Serial configuration - MUST MATCH ARDUINO
-BAUD_RATE = 115200
+# 500000 baud ships a 73-LED frame in ~4.5ms vs ~19.5ms at 115200
+BAUD_RATE = 500000
 
 
 def set_low_priority():
@@ -51,9 +53,10 @@ def set_low_priority():
 
 class Ambilight:
     """✨ Low CPU Ambilight controller."""
-    def __init__(self, port=None, monitor=0, fps=60, brightness=255, 
-                 saturation=1.2, smoothing=0.6):
+    def __init__(self, port=None, monitor=0, fps=60, brightness=255,
+                 saturation=1.2, smoothing=0.6, baud=BAUD_RATE):
         self.monitor_num = monitor
+        self.baud = baud
         self.target_fps = min(fps, 60)  # Cap at 60
         self.brightness = brightness / 255.0
         self.saturation = saturation
@@ -92,30 +95,45 @@ class Ambilight:
         self.height = mon['height']
         d = min(CAPTURE_DEPTH, 50)
         
-        # Define 3 small capture regions instead of full screen
-        self.left_region = {
-            'left': mon['left'],
-            'top': mon['top'],
-            'width': d,
-            'height': mon['height']
+        # Three thin strip regions: with GDI capture the grab cost
+        # scales with the copied area, so ~0.5 MB of edge strips beats
+        # one full-frame copy (~8 MB at 1080p) every frame
+        self.regions = {
+            'left': {'left': mon['left'], 'top': mon['top'],
+                     'width': d, 'height': mon['height']},
+            'top': {'left': mon['left'], 'top': mon['top'],
+                    'width': mon['width'], 'height': d},
+            'right': {'left': mon['left'] + mon['width'] - d, 'top': mon['top'],
+                      'width': d, 'height': mon['height']}
         }
-        self.top_region = {
-            'left': mon['left'],
-            'top': mon['top'],
-            'width': mon['width'],
-            'height': d
-        }
-        self.right_region = {
-            'left': mon['left'] + mon['width'] - d,
-            'top': mon['top'],
-            'width': d,
-            'height': mon['height']
-        }
-        
+
         # Pre-compute segment sizes
         self.v_seg = self.height // NUM_LEDS_LEFT  # Vertical segment height
         self.h_seg = self.width // NUM_LEDS_TOP    # Horizontal segment width
-        
+
+        # Sizes of the [::ds, ::ds] downsampled edge views
+        ds = DOWNSAMPLE
+        depth_px = (d + ds - 1) // ds
+        h_ds = (self.height + ds - 1) // ds
+        w_ds = (self.width + ds - 1) // ds
+
+        # Segment boundaries for np.add.reduceat, in downsampled
+        # coordinates. The left strip runs bottom-to-top, so its segments
+        # are stored top-to-bottom and the per-frame means get reversed
+        # at assignment time.
+        y0 = self.height - NUM_LEDS_LEFT * self.v_seg
+        self.left_starts = (y0 + np.arange(NUM_LEDS_LEFT) * self.v_seg) // ds
+        self.top_starts = (np.arange(NUM_LEDS_TOP) * self.h_seg) // ds
+        self.right_starts = (np.arange(NUM_LEDS_RIGHT) * self.v_seg) // ds
+
+        # Pixels per segment (last segment absorbs the division remainder)
+        left_ends = np.append(self.left_starts[1:], h_ds)
+        top_ends = np.append(self.top_starts[1:], w_ds)
+        right_ends = np.append(self.right_starts[1:], h_ds)
+        self.left_counts = ((left_ends - self.left_starts) * depth_px).astype(np.float32)
+        self.top_counts = ((top_ends - self.top_starts) * depth_px).astype(np.float32)
+        self.right_counts = ((right_ends - self.right_starts) * depth_px).astype(np.float32)
+
         print(f"📺 Monitor {self.monitor_num}: {self.width}x{self.height}")
     
     def connect_serial(self, port=None):
@@ -134,7 +152,7 @@ class Ambilight:
         
         print(f"🔌 Connecting to {port}...")
         try:
-            ser = serial.Serial(port, BAUD_RATE, timeout=1)
+            ser = serial.Serial(port, self.baud, timeout=1)
             time.sleep(2)
             ser.reset_input_buffer()
             # Wait for ready
@@ -151,35 +169,45 @@ class Ambilight:
             sys.exit(1)
     
     def capture_and_sample(self):
-        """📷 Capture edges and sample colors in one pass - OPTIMIZED."""
+        """📷 Capture one frame and sample edge colors - OPTIMIZED."""
         colors = self.colors
-        
-        # Capture and process LEFT edge
-        shot = self.sct.grab(self.left_region)
-        img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
-        seg_h = self.v_seg
-        # Bottom to top (reversed)
-        for i in range(NUM_LEDS_LEFT):
-            y = self.height - (i + 1) * seg_h
-            colors[i] = img[y:y+seg_h, :, [2,1,0]].mean(axis=(0,1))
-        
-        # Capture and process TOP edge  
-        shot = self.sct.grab(self.top_region)
-        img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
-        seg_w = self.h_seg
+        ds = DOWNSAMPLE
+
+        # One grab per edge strip - the strips are thin, so the three
+        # BitBlts together copy far less than one full-frame grab
+        shot = self.sct.grab(self.regions['left'])
+        left = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4)
+
+        # LEFT edge: one strided view shared by all LEDs, collapse the
+        # depth axis, then one reduceat over the rows
+        col_sum = left[::ds, ::ds, :3].sum(axis=1, dtype=np.float32)
+        seg_sums = np.add.reduceat(col_sum, self.left_starts, axis=0)
+        # Segments are top-to-bottom, LEDs bottom-to-top
+        colors[:NUM_LEDS_LEFT] = (seg_sums / self.left_counts[:, None])[::-1]
+
+        # TOP edge: collapse rows, reduceat over columns
+        shot = self.sct.grab(self.regions['top'])
+        top = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4)
+        row_sum = top[::ds, ::ds, :3].sum(axis=0, dtype=np.float32)
+        seg_sums = np.add.reduceat(row_sum, self.top_starts, axis=0)
         idx = NUM_LEDS_LEFT
-        for i in range(NUM_LEDS_TOP):
-            x = i * seg_w
-            colors[idx + i] = img[:, x:x+seg_w, [2,1,0]].mean(axis=(0,1))
-        
-        # Capture and process RIGHT edge
-        shot = self.sct.grab(self.right_region)
-        img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        colors[idx:idx + NUM_LEDS_TOP] = (seg_sums / self.top_counts[:, None])
+
+        # RIGHT edge
+        shot = self.sct.grab(self.regions['right'])
+        right = np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4)
+        col_sum = right[::ds, ::ds, :3].sum(axis=1, dtype=np.float32)
+        seg_sums = np.add.reduceat(col_sum, self.right_starts, axis=0)
         idx = NUM_LEDS_LEFT + NUM_LEDS_TOP
-        for i in range(NUM_LEDS_RIGHT):
-            y = i * seg_h
-            colors[idx + i] = img[y:y+seg_h, :, [2,1,0]].mean(axis=(0,1))
-        
+        colors[idx:idx + NUM_LEDS_RIGHT] = (seg_sums / self.right_counts[:, None])
+
+        # Means were accumulated in BGR order; one strided flip of the
+        # 73x3 result converts every LED to RGB at once
+        colors[:] = colors[:, ::-1]
+
         return colors
     
     def process_colors(self, colors):
@@ -274,6 +302,7 @@ def main():
     parser.add_argument('--brightness', '-b', type=int, default=255, help='Brightness 0-255 ☀️')
     parser.add_argument('--saturation', '-s', type=float, default=1.2, help='Saturation boost 🎨')
     parser.add_argument('--smoothing', type=float, default=0.6, help='0.3=smooth, 0.7=responsive (default: 0.6) 🌊')
+    parser.add_argument('--baud', type=int, default=BAUD_RATE, help=f'Serial baud rate, must match Arduino (default: {BAUD_RATE})')
     parser.add_argument('--list-ports', action='store_true', help='List serial ports and exit 🔍')
     
     args = parser.parse_args()
@@ -293,7 +322,8 @@ def main():
         fps=args.fps,
         brightness=args.brightness,
         saturation=args.saturation,
-        smoothing=args.smoothing
+        smoothing=args.smoothing,
+        baud=args.baud
     ).run()
 
 
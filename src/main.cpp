@@ -23,7 +23,7 @@
 #define BRIGHTNESS 255
 
 // Serial Configuration
-#define SERIAL_RATE 115200  // High speed serial (was 115200)
+#define SERIAL_RATE 500000  // High speed serial (must match PC app --baud)
 #define IDLE_TIMEOUT 5000   // ms before showing ambient color
 #define OFF_TIMEOUT 600000  // ms (10 min) before turning off
 